@@ -4,6 +4,7 @@ parameter styles.
 """
 from __future__ import annotations
 
+import functools
 import re
 from typing import (
 	Any,
@@ -383,6 +384,7 @@ class SQLParams(object):
 		return converter
 
 	@staticmethod
+	@functools.lru_cache(maxsize=128)
 	def __create_in_regex(
 		escape_char: str,
 		in_obj: _styles.Style,
@@ -399,6 +401,7 @@ class SQLParams(object):
 		*out_obj* (:class:`._styles.Style`) is the out-style parameter object.
 
 		Returns the in-style parameter regular expression (:class:`re.Pattern`).
+		The result is cached because the styles are shared singletons.
 		"""
 		regex_parts = []
 
@@ -2,19 +2,25 @@
 This module contains internal classes used for converting parameter styles.
 """
 
+import collections
 import itertools
+import threading
 from collections.abc import (
 	Mapping)
 from functools import (
 	partial)
+from operator import (
+	itemgetter)
 from typing import (
 	Any,
+	Callable,  # Replaced by `collections.abc.Callable` in 3.9.
 	Dict,  # Replaced by `dict` in 3.9.
 	Iterable,  # Replaced by `collections.abc.Iterable` in 3.9.
 	Iterator,  # Replaced by `collections.abc.Iterator` in 3.9.
 	List,  # Replaced by `list` in 3.9.
 	Match,  # Replaced by `re.Match` in 3.9.
 	Optional,  # Replaced by `X | None` in 3.10.
+	OrderedDict,  # Replaced by `collections.OrderedDict` in 3.9.
 	Pattern,  # Replaced by `re.Pattern` in 3.9.
 	Sequence,  # Replaced by `collections.abc.Sequence` in 3.9.
 	Tuple,  # Replaced by `tuple` in 3.9.
@@ -24,6 +30,23 @@ from . import _styles
 from ._util import (
 	is_sequence)
 
+_QUERY_CACHE_SIZE = 256
+"""
+The maximum number of converted SQL queries to cache per converter.
+"""
+
+_QUERY_CACHE_MAX_PARAMS = 256
+"""
+The maximum number of parameter conversions of a converted SQL query to cache.
+"""
+
+_QUERY_CACHE_MAX_SQL = 4096
+"""
+The maximum length of a SQL query (in-style or out-style) to cache. Larger
+queries (e.g., generated bulk inserts) are rarely repeated, and would hold on
+to too much memory.
+"""
+
 
 class Converter(object):
 	"""
@@ -31,6 +54,18 @@ class Converter(object):
 	conversion from one in-style parameter to another out-style parameter.
 	"""
 
+	__slots__ = (
+		'_escape_start',
+		'_expand_tuples',
+		'_in_regex',
+		'_in_style',
+		'_out_format',
+		'_out_quotes',
+		'_out_style',
+		'__query_cache',
+		'__query_cache_lock',
+	)
+
 	def __init__(
 		self,
 		escape_char: Optional[str],
@@ -84,6 +119,20 @@ class Converter(object):
 		*_out_style* (:class:`._styles.Style`) is the out-style to use.
 		"""
 
+		self.__query_cache: OrderedDict[Tuple[str, Tuple[Tuple[Any, int], ...]], Tuple[str, List[tuple]]] = collections.OrderedDict()
+		"""
+		*__query_cache* (:class:`collections.OrderedDict`) maps the cache key
+		(:class:`tuple`) to a previously converted SQL query (:class:`str`) and its
+		parameter conversions (:class:`list`). It is kept in least recently used
+		order.
+		"""
+
+		self.__query_cache_lock = threading.Lock()
+		"""
+		*__query_cache_lock* (:class:`threading.Lock`) guards access to the query
+		cache so the converter can be shared between threads.
+		"""
+
 	def convert(
 		self,
 		sql: str,
@@ -123,6 +172,108 @@ class Converter(object):
 		"""
 		raise NotImplementedError(f"{self.__class__.__qualname__} must implement convert_many().")
 
+	def _convert_query(
+		self,
+		sql: str,
+		params: Union[Dict[Union[str, int], Any], Sequence[Any]],
+	) -> Tuple[str, List[tuple]]:
+		"""
+		Convert the SQL query to use the out-style parameters. The result is
+		cached, and reused for the same SQL query when the parameters have the
+		same shape. Large SQL queries are not cached.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Mapping` or :class:`~collections.abc.Sequence`)
+		contains the in-style parameters to sample.
+
+		Returns a :class:`tuple` containing: the converted SQL query (:class:`str`),
+		and the parameter conversions to perform (:class:`list`). The parameter
+		conversions are shared, and must not be modified.
+		"""
+		cache_key = self.__get_cache_key(sql, params)
+		if cache_key is not None:
+			with self.__query_cache_lock:
+				result = self.__query_cache.get(cache_key)
+				if result is not None:
+					self.__query_cache.move_to_end(cache_key)
+					return result
+
+		param_conversions = []
+		out_sql = self._sub_query(sql, params, param_conversions)
+		result = (out_sql, param_conversions)
+
+		if (
+			cache_key is not None
+			and len(out_sql) <= _QUERY_CACHE_MAX_SQL
+			and len(param_conversions) <= _QUERY_CACHE_MAX_PARAMS
+		):
+			with self.__query_cache_lock:
+				if cache_key not in self.__query_cache and len(self.__query_cache) >= _QUERY_CACHE_SIZE:
+					# Evict the least recently used query.
+					self.__query_cache.popitem(last=False)
+
+				self.__query_cache[cache_key] = result
+
+		return result
+
+	def _sub_query(
+		self,
+		sql: str,
+		params: Union[Dict[Union[str, int], Any], Sequence[Any]],
+		param_conversions: List[tuple],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Mapping` or :class:`~collections.abc.Sequence`)
+		contains the in-style parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		raise NotImplementedError(f"{self.__class__.__qualname__} must implement _sub_query().")
+
+	def __get_cache_key(
+		self,
+		sql: str,
+		params: Union[Dict[Union[str, int], Any], Sequence[Any]],
+	) -> Optional[Tuple[str, Tuple[Tuple[Any, int], ...]]]:
+		"""
+		Get the key used to cache the converted SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Mapping` or :class:`~collections.abc.Sequence`)
+		contains the in-style parameters to sample.
+
+		Returns the cache key (:class:`tuple`), or ``None`` if the converted SQL
+		query cannot be cached.
+		"""
+		if len(sql) > _QUERY_CACHE_MAX_SQL:
+			# Large SQL queries are not cached.
+			return None
+
+		elif self._in_style.param_quotes:
+			# Quoted in-parameters are resolved against the parameter names so the
+			# conversion depends on more than the SQL query.
+			return None
+
+		elif not self._expand_tuples:
+			return (sql, ())
+
+		# The expanded SQL query depends on the length of each tuple parameter.
+		items = params.items() if isinstance(params, Mapping) else enumerate(params)
+		return (sql, tuple([
+			(__key, len(__value))
+			for __key, __value in items
+			if isinstance(__value, tuple)
+		]))
+
 
 class NamedConverter(Converter):
 	"""
@@ -130,6 +281,8 @@ class NamedConverter(Converter):
 	conversion from one named in-style parameter to another out-style parameter.
 	"""
 
+	__slots__ = ()
+
 	_in_style: _styles.NamedStyle
 
 
@@ -139,6 +292,8 @@ class NamedToNamedConverter(NamedConverter):
 	parameters to named out-style parameters.
 	"""
 
+	__slots__ = ()
+
 	def convert(
 		self,
 		sql: str,
@@ -160,8 +315,7 @@ class NamedToNamedConverter(NamedConverter):
 			raise TypeError(f"{params=!r} is not a mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -192,14 +346,34 @@ class NamedToNamedConverter(NamedConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Dict[str, Any],
+		param_conversions: List[Tuple[bool, str, Union[str, List[str]]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Mapping`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions), sql)
+
 	@staticmethod
 	def __convert_many_params(
 		many_in_params: Iterable[Dict[str, Any]],
@@ -372,6 +546,8 @@ class NamedToNumericConverter(NamedConverter):
 	in-style parameters to numeric out-style parameters.
 	"""
 
+	__slots__ = ('__out_start',)
+
 	_out_style: _styles.NumericStyle
 
 	def __init__(self, **kw) -> None:
@@ -407,10 +583,7 @@ class NamedToNumericConverter(NamedConverter):
 			raise TypeError(f"{params=!r} is not a mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_counter = itertools.count()
-		out_lookup = {}
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, out_counter, out_lookup), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -442,16 +615,36 @@ class NamedToNumericConverter(NamedConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_counter = itertools.count()
-		out_lookup = {}
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions, out_counter, out_lookup), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Dict[str, Any],
+		param_conversions: List[Tuple[bool, str, Union[int, List[int]]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Mapping`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		out_counter = itertools.count()
+		out_lookup = {}
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, out_counter, out_lookup), sql)
+
 	@staticmethod
 	def __convert_many_params(
 		many_in_params: Iterable[Dict[str, Any]],
@@ -482,6 +675,19 @@ class NamedToNumericConverter(NamedConverter):
 		size = (last_conv[2][-1] if last_conv[0] else last_conv[2]) + 1
 
 		many_out_params = []
+		if not any(__conv[0] for __conv in param_conversions):
+			# Only simple conversions, so each out-index is the position of its
+			# in-name.
+			get_values = _create_getter([__conv[1] for __conv in param_conversions])
+			for i, in_params in enumerate(many_in_params):
+				# NOTE: First set has already been checked.
+				if i and not isinstance(in_params, Mapping):
+					raise TypeError(f"many_params[{i}]={in_params!r} is not a mapping.")
+
+				many_out_params.append(list(get_values(in_params)))
+
+			return many_out_params
+
 		for i, in_params in enumerate(many_in_params):
 			# NOTE: First set has already been checked.
 			if i and not isinstance(in_params, Mapping):
@@ -651,6 +857,8 @@ class NamedToOrdinalConverter(NamedConverter):
 	parameters to ordinal out-style parameters.
 	"""
 
+	__slots__ = ()
+
 	_out_style: _styles.OrdinalStyle
 
 	def convert(
@@ -674,9 +882,7 @@ class NamedToOrdinalConverter(NamedConverter):
 			raise TypeError(f"{params=!r} is not a mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_format = self._out_style.out_format
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, out_format), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -707,15 +913,35 @@ class NamedToOrdinalConverter(NamedConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_format = self._out_style.out_format
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions, out_format), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Dict[str, Any],
+		param_conversions: List[Tuple[bool, str, Optional[int]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Mapping`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		out_format = self._out_style.out_format
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, out_format), sql)
+
 	@staticmethod
 	def __convert_many_params(
 		many_in_params: Iterable[Dict[str, Any]],
@@ -739,6 +965,19 @@ class NamedToOrdinalConverter(NamedConverter):
 		Returns the many out-style parameters (:class:`list` of :class:`list`).
 		"""
 		many_out_params = []
+		if not any(__conv[0] for __conv in param_conversions):
+			# Only simple conversions, so each out-parameter is the value of its
+			# in-name.
+			get_values = _create_getter([__conv[1] for __conv in param_conversions])
+			for i, in_params in enumerate(many_in_params):
+				# NOTE: First set has already been checked.
+				if i and not isinstance(in_params, Mapping):
+					raise TypeError(f"many_params[{i}]={in_params!r} is not a mapping.")
+
+				many_out_params.append(list(get_values(in_params)))
+
+			return many_out_params
+
 		for i, in_params in enumerate(many_in_params):
 			# NOTE: First set has already been checked.
 			if i and not isinstance(in_params, Mapping):
@@ -754,8 +993,7 @@ class NamedToOrdinalConverter(NamedConverter):
 					elif len(values) != out_count:
 						raise ValueError(f"many_params[{i}][{in_name!r}]={values!r} length was expected to be {out_count}.")
 
-					for sub_value in values:
-						out_params.append(sub_value)
+					out_params.extend(values)
 
 				else:
 					# Simple conversion.
@@ -791,8 +1029,7 @@ class NamedToOrdinalConverter(NamedConverter):
 		for expand_tuple, in_name, _out_count in param_conversions:
 			if expand_tuple:
 				# Tuple conversion.
-				for sub_value in in_params[in_name]:
-					out_params.append(sub_value)
+				out_params.extend(in_params[in_name])
 
 			else:
 				# Simple conversion.
@@ -871,6 +1108,8 @@ class NumericConverter(Converter):
 	conversion from one numeric in-style parameter to another out-style parameter.
 	"""
 
+	__slots__ = ('_in_start',)
+
 	_in_style: _styles.NumericStyle
 
 	def __init__(self, **kw) -> None:
@@ -910,6 +1149,8 @@ class NumericToNamedConverter(NumericConverter):
 	in-style parameters to named out-style parameters.
 	"""
 
+	__slots__ = ()
+
 	_out_style: _styles.NamedStyle
 
 	def convert(
@@ -937,8 +1178,7 @@ class NumericToNamedConverter(NumericConverter):
 			raise TypeError(f"{params=!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -974,14 +1214,34 @@ class NumericToNamedConverter(NumericConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Sequence[Any],
+		param_conversions: List[Tuple[bool, int, Union[str, List[str]]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Sequence`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions), sql)
+
 	def __convert_many_params(
 		self,
 		many_in_params: Union[Iterable[Sequence[Any]], Iterable[Dict[Union[int, str], Any]]],
@@ -1147,6 +1407,8 @@ class NumericToNumericConverter(NumericConverter):
 	in-style parameters to numeric out-style parameters.
 	"""
 
+	__slots__ = ('__out_start',)
+
 	_out_style: _styles.NumericStyle
 
 	def __init__(self, **kw) -> None:
@@ -1186,10 +1448,7 @@ class NumericToNumericConverter(NumericConverter):
 			raise TypeError(f"{params=!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_counter = itertools.count()
-		out_lookup = {}
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, out_counter, out_lookup), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -1225,16 +1484,36 @@ class NumericToNumericConverter(NumericConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_counter = itertools.count()
-		out_lookup = {}
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions, out_counter, out_lookup), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Sequence[Any],
+		param_conversions: List[Tuple[bool, int, Union[int, List[int]]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Sequence`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		out_counter = itertools.count()
+		out_lookup = {}
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, out_counter, out_lookup), sql)
+
 	def __convert_many_params(
 		self,
 		many_in_params: Union[Iterable[Sequence[Any]], Iterable[Dict[Union[int, str], Any]]],
@@ -1262,6 +1541,15 @@ class NumericToNumericConverter(NumericConverter):
 		size = (last_conv[2][-1] if last_conv[0] else last_conv[2]) + 1
 
 		many_out_params = []
+		if not any(__conv[0] for __conv in param_conversions):
+			# Only simple conversions, so each out-index is the position of its
+			# in-index.
+			return _get_many_sequence_values(
+				many_in_params,
+				[__conv[1] for __conv in param_conversions],
+				self._mapping_as_sequence,
+			)
+
 		for i, in_params in enumerate(many_in_params):
 			# NOTE: First set has already been checked.
 			if i:
@@ -1425,6 +1713,8 @@ class NumericToOrdinalConverter(NumericConverter):
 	in-style parameters to ordinal out-style parameters.
 	"""
 
+	__slots__ = ()
+
 	_out_style: _styles.OrdinalStyle
 
 	def convert(
@@ -1452,9 +1742,7 @@ class NumericToOrdinalConverter(NumericConverter):
 			raise TypeError(f"{params=!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_format = self._out_style.out_format
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, out_format), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -1490,15 +1778,35 @@ class NumericToOrdinalConverter(NumericConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		out_format = self._out_style.out_format
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions, out_format), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Sequence[Any],
+		param_conversions: List[Tuple[bool, int, Optional[int]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Sequence`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		out_format = self._out_style.out_format
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, out_format), sql)
+
 	def __convert_many_params(
 		self,
 		many_in_params: Iterable[Sequence[Any]],
@@ -1522,6 +1830,15 @@ class NumericToOrdinalConverter(NumericConverter):
 		Returns the many out-style parameters (:class:`list` of :class:`list`).
 		"""
 		many_out_params = []
+		if not any(__conv[0] for __conv in param_conversions):
+			# Only simple conversions, so each out-parameter is the value of its
+			# in-index.
+			return _get_many_sequence_values(
+				many_in_params,
+				[__conv[1] for __conv in param_conversions],
+				self._mapping_as_sequence,
+			)
+
 		for i, in_params in enumerate(many_in_params):
 			# NOTE: First set has already been checked.
 			if i:
@@ -1542,8 +1859,7 @@ class NumericToOrdinalConverter(NumericConverter):
 					elif len(values) != out_count:
 						raise ValueError(f"many_params[{i}][{in_index!r}]={values!r} length was expected to be {out_count}.")
 
-					for sub_value in values:
-						out_params.append(sub_value)
+					out_params.extend(values)
 
 				else:
 					# Simple conversion.
@@ -1579,8 +1895,7 @@ class NumericToOrdinalConverter(NumericConverter):
 		for expand_tuple, in_index, _out_count in param_conversions:
 			if expand_tuple:
 				# Tuple conversion.
-				for sub_value in in_params[in_index]:
-					out_params.append(sub_value)
+				out_params.extend(in_params[in_index])
 
 			else:
 				# Simple conversion.
@@ -1648,6 +1963,8 @@ class OrdinalConverter(Converter):
 	conversion from one ordinal in-style parameter to another out-style parameter.
 	"""
 
+	__slots__ = ()
+
 	@staticmethod
 	def _mapping_as_sequence(
 		in_params: Dict[Union[int, str], Any],
@@ -1672,6 +1989,8 @@ class OrdinalToNamedConverter(OrdinalConverter):
 	in-style parameters to named out-style parameters.
 	"""
 
+	__slots__ = ()
+
 	_out_style: _styles.NamedStyle
 
 	def convert(
@@ -1699,9 +2018,7 @@ class OrdinalToNamedConverter(OrdinalConverter):
 			raise TypeError(f"{params=!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		in_counter = itertools.count()
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, in_counter), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -1737,15 +2054,35 @@ class OrdinalToNamedConverter(OrdinalConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		in_counter = itertools.count()
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions, in_counter), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Sequence[Any],
+		param_conversions: List[Tuple[bool, int, Union[str, List[str]]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Sequence`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		in_counter = itertools.count()
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, in_counter), sql)
+
 	@classmethod
 	def __convert_many_params(
 		cls,
@@ -1915,6 +2252,8 @@ class OrdinalToNumericConverter(OrdinalConverter):
 	in-style parameters to numeric out-style parameters.
 	"""
 
+	__slots__ = ('__out_start',)
+
 	_out_style: _styles.NumericStyle
 
 	def __init__(self, **kw):
@@ -1954,10 +2293,7 @@ class OrdinalToNumericConverter(OrdinalConverter):
 			raise TypeError(f"{params=!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		in_counter = itertools.count()
-		out_counter = itertools.count()
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, in_counter, out_counter), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -1993,16 +2329,36 @@ class OrdinalToNumericConverter(OrdinalConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		in_counter = itertools.count()
-		out_counter = itertools.count()
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions, in_counter, out_counter), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Sequence[Any],
+		param_conversions: List[Tuple[bool, int, Union[int, List[int]]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Sequence`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		in_counter = itertools.count()
+		out_counter = itertools.count()
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, in_counter, out_counter), sql)
+
 	@classmethod
 	def __convert_many_params(
 		cls,
@@ -2031,6 +2387,15 @@ class OrdinalToNumericConverter(OrdinalConverter):
 		size = (last_conv[2][-1] if last_conv[0] else last_conv[2]) + 1
 
 		many_out_params = []
+		if not any(__conv[0] for __conv in param_conversions):
+			# Only simple conversions, so each out-index is the position of its
+			# in-index.
+			return _get_many_sequence_values(
+				many_in_params,
+				[__conv[1] for __conv in param_conversions],
+				cls._mapping_as_sequence,
+			)
+
 		for i, in_params in enumerate(many_in_params):
 			# NOTE: First set has already been checked.
 			if i:
@@ -2175,6 +2540,8 @@ class OrdinalToOrdinalConverter(OrdinalConverter):
 	in-style parameters to ordinal out-style parameters.
 	"""
 
+	__slots__ = ()
+
 	_out_style: _styles.OrdinalStyle
 
 	def convert(
@@ -2202,10 +2569,7 @@ class OrdinalToOrdinalConverter(OrdinalConverter):
 			raise TypeError(f"{params=!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		in_counter = itertools.count()
-		out_format = self._out_style.out_format
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, in_counter, out_format), sql)
+		out_sql, param_conversions = self._convert_query(sql, params)
 
 		# Convert parameters.
 		out_params = self.__convert_params(params, param_conversions)
@@ -2242,16 +2606,36 @@ class OrdinalToOrdinalConverter(OrdinalConverter):
 			raise TypeError(f"many_params[0]={first_params!r} is not a sequence or mapping.")
 
 		# Convert query.
-		param_conversions = []
-		in_counter = itertools.count()
-		out_format = self._out_style.out_format
-		out_sql = self._in_regex.sub(partial(self.__regex_replace, first_params, param_conversions, in_counter, out_format), sql)
+		out_sql, param_conversions = self._convert_query(sql, first_params)
 
 		# Convert parameters.
 		out_params = self.__convert_many_params(itertools.chain((first_params,), iter_params), param_conversions)
 
 		return out_sql, out_params
 
+	def _sub_query(
+		self,
+		sql: str,
+		params: Sequence[Any],
+		param_conversions: List[Tuple[bool, int, Optional[int]]],
+	) -> str:
+		"""
+		Replace the in-style parameters in the SQL query.
+
+		*sql* (:class:`str`) is the SQL query.
+
+		*params* (:class:`~collections.abc.Sequence`) contains the in-style
+		parameters to sample.
+
+		*param_conversions* (:class:`list`) will be outputted with each parameter
+		conversion to perform (:class:`tuple`).
+
+		Returns the converted SQL query (:class:`str`).
+		"""
+		in_counter = itertools.count()
+		out_format = self._out_style.out_format
+		return self._in_regex.sub(partial(self.__regex_replace, params, param_conversions, in_counter, out_format), sql)
+
 	@classmethod
 	def __convert_many_params(
 		cls,
@@ -2276,6 +2660,15 @@ class OrdinalToOrdinalConverter(OrdinalConverter):
 		Returns the many out-style parameters (:class:`list` of :class:`list`).
 		"""
 		many_out_params = []
+		if not any(__conv[0] for __conv in param_conversions):
+			# Only simple conversions, so each out-parameter is the value of its
+			# in-index.
+			return _get_many_sequence_values(
+				many_in_params,
+				[__conv[1] for __conv in param_conversions],
+				cls._mapping_as_sequence,
+			)
+
 		for i, in_params in enumerate(many_in_params):
 			# NOTE: First set has already been checked.
 			if i:
@@ -2296,8 +2689,7 @@ class OrdinalToOrdinalConverter(OrdinalConverter):
 					elif len(values) != out_count:
 						raise ValueError(f"many_params[{i}][{in_index!r}]={values!r} length was expected to be {out_count}.")
 
-					for sub_value in values:
-						out_params.append(sub_value)
+					out_params.extend(values)
 
 				else:
 					# Simple conversion.
@@ -2333,8 +2725,7 @@ class OrdinalToOrdinalConverter(OrdinalConverter):
 		for expand_tuple, in_index, _out_count in param_conversions:
 			if expand_tuple:
 				# Tuple conversion.
-				for sub_value in in_params[in_index]:
-					out_params.append(sub_value)
+				out_params.extend(in_params[in_index])
 
 			else:
 				# Simple conversion.
@@ -2400,6 +2791,61 @@ class OrdinalToOrdinalConverter(OrdinalConverter):
 				return out_format
 
 
+def _create_getter(keys: Sequence[Any]) -> Callable[[Any], Tuple[Any, ...]]:
+	"""
+	Create a function to get the values for the keys from a container.
+
+	*keys* (:class:`~collections.abc.Sequence`) contains the keys to get.
+
+	Returns the function (:class:`~collections.abc.Callable`) which returns the
+	values (:class:`tuple`).
+	"""
+	if len(keys) == 1:
+		# NOTE: An item getter for a single key returns the bare value.
+		key = keys[0]
+		return lambda __container: (__container[key],)
+
+	return itemgetter(*keys)
+
+
+def _get_many_sequence_values(
+	many_in_params: Union[Iterable[Sequence[Any]], Iterable[Dict[Union[int, str], Any]]],
+	keys: Sequence[int],
+	mapping_as_sequence: Callable[[Dict[Union[int, str], Any]], Dict[int, Any]],
+) -> List[List[Any]]:
+	"""
+	Get the values for the in-indices from each set of numeric or ordinal
+	in-style parameters.
+
+	*many_in_params* (:class:`~collections.abc.Iterable`) contains each set of
+	in-style parameters.
+
+	*keys* (:class:`~collections.abc.Sequence`) contains the in-index
+	(:class:`int`) of each value to get.
+
+	*mapping_as_sequence* (:class:`~collections.abc.Callable`) converts a set of
+	in-style parameters (:class:`~collections.abc.Mapping`) to mimic a
+	sequence.
+
+	Returns the many out-style parameters (:class:`list` of :class:`list`).
+	"""
+	get_values = _create_getter(keys)
+	many_out_params = []
+	for i, in_params in enumerate(many_in_params):
+		# NOTE: First set has already been checked.
+		if i:
+			if is_sequence(in_params):
+				pass
+			elif isinstance(in_params, Mapping):
+				in_params = mapping_as_sequence(in_params)
+			else:
+				raise TypeError(f"many_params[{i}]={in_params!r} is not a mapping.")
+
+		many_out_params.append(list(get_values(in_params)))
+
+	return many_out_params
+
+
 def _quote_oracle_param(param: str) -> str:
 	"""
 	Quote the Oracle parameter.
@@ -16,6 +16,15 @@ class Style(object):
 	The :class:`.Style` class is the base class used to define a parameter style.
 	"""
 
+	__slots__ = (
+		'escape_char',
+		'escape_regex',
+		'name',
+		'out_format',
+		'param_quotes',
+		'param_regex',
+	)
+
 	def __init__(
 		self,
 		name: str,
@@ -68,7 +77,8 @@ class NamedStyle(Style):
 	"""
 	The :class:`.NamedStyle` class is used to define a named parameter style.
 	"""
-	pass
+
+	__slots__ = ()
 
 
 class NumericStyle(Style):
@@ -76,6 +86,8 @@ class NumericStyle(Style):
 	The :class:`.NumericStyle` class is used to define a numeric parameter style.
 	"""
 
+	__slots__ = ('start',)
+
 	def __init__(self, start: int, **kw) -> None:
 		"""
 		Initializes the :class:`.NumericStyle` instances.
@@ -93,7 +105,8 @@ class OrdinalStyle(Style):
 	"""
 	The :class:`.OrdinalStyle` class is used to define an ordinal parameter style.
 	"""
-	pass
+
+	__slots__ = ()
 
 
 # Define standard "format" parameter style.
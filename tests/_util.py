@@ -0,0 +1,23 @@
+"""
+This module defines utility methods shared by the tests.
+"""
+
+import functools
+
+import sqlparams
+
+
+@functools.lru_cache(maxsize=None)
+def get_query(*args, **kw) -> sqlparams.SQLParams:
+	"""
+	Get the shared :class:`sqlparams.SQLParams` instance for the arguments. The
+	only state an instance keeps is its cache of converted SQL queries, which is
+	keyed by the SQL query and the shape of the tuple parameters, so reusing it
+	across tests does not make the results depend on the test order.
+
+	*args* and *kw* are the positional and keyword arguments to pass to
+	:class:`sqlparams.SQLParams`. They must be hashable.
+
+	Returns the instance (:class:`sqlparams.SQLParams`).
+	"""
+	return sqlparams.SQLParams(*args, **kw)
@@ -2,9 +2,14 @@
 This package tests the general implementation of sqlparams.
 """
 
+import threading
 import unittest
+from unittest import (
+	mock)
 
 import sqlparams
+from sqlparams import (
+	_converting)
 
 
 class Test(unittest.TestCase):
@@ -472,3 +477,320 @@ class Test(unittest.TestCase):
 		# Make sure desired SQL and parameters are created.
 		self.assertEqual(sql, dest_sql)
 		self.assertEqual(params, dest_params)
+
+	def test_6_reuse_query(self) -> None:
+		"""
+		Test formatting the same query again with different parameters.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('named', 'qmark')
+
+		# Source SQL.
+		src_sql = """
+			SELECT *
+			FROM users
+			WHERE id = :id OR name = :name OR id = :id;
+		"""
+
+		# Desired SQL.
+		dest_sql = """
+			SELECT *
+			FROM users
+			WHERE id = ? OR name = ? OR id = ?;
+		"""
+
+		for src_params, dest_params in [
+			({'id': 5, 'name': "Oin"}, [5, "Oin", 5]),
+			({'id': 6, 'name': "Gloin"}, [6, "Gloin", 6]),
+		]:
+			with self.subTest(src_params=src_params):
+				# Format SQL with params.
+				sql, params = query.format(src_sql, src_params)
+
+				# Make sure desired SQL and parameters are created.
+				self.assertEqual(sql, dest_sql)
+				self.assertEqual(params, dest_params)
+
+	def test_6_reuse_query_expand_tuples(self) -> None:
+		"""
+		Test formatting the same query again with tuples of different lengths.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('numeric', 'qmark', expand_tuples=True)
+
+		# Source SQL.
+		src_sql = "SELECT * FROM users WHERE race = :1 AND name IN :2;"
+
+		for src_params, dest_sql, dest_params in [
+			(
+				["Dwarf", ("Kili", "Fili")],
+				"SELECT * FROM users WHERE race = ? AND name IN (?,?);",
+				["Dwarf", "Kili", "Fili"],
+			),
+			(
+				["Dwarf", ("Dori", "Nori", "Ori")],
+				"SELECT * FROM users WHERE race = ? AND name IN (?,?,?);",
+				["Dwarf", "Dori", "Nori", "Ori"],
+			),
+			(
+				["Dwarf", ()],
+				"SELECT * FROM users WHERE race = ? AND name IN (NULL);",
+				["Dwarf"],
+			),
+			(
+				[("Dwarf", "Hobbit"), "Bilbo"],
+				"SELECT * FROM users WHERE race = (?,?) AND name IN ?;",
+				["Dwarf", "Hobbit", "Bilbo"],
+			),
+		]:
+			with self.subTest(src_params=src_params):
+				# Format SQL with params.
+				sql, params = query.format(src_sql, src_params)
+
+				# Make sure desired SQL and parameters are created.
+				self.assertEqual(sql, dest_sql)
+				self.assertEqual(params, dest_params)
+
+	def test_6_reuse_query_missing(self) -> None:
+		"""
+		Test formatting the same query again without a parameter.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('named', 'qmark')
+
+		# Source SQL.
+		src_sql = "SELECT * FROM users WHERE id = :id OR name = :name;"
+
+		# Format SQL with params.
+		query.format(src_sql, {'id': 7, 'name': "Bifur"})
+
+		# Make sure a missing parameter still fails.
+		with self.assertRaises(KeyError):
+			query.format(src_sql, {'id': 8})
+
+	def test_6_reuse_query_many(self) -> None:
+		"""
+		Test formatting the same query again with many sets of parameters with
+		tuples of different lengths.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=True)
+
+		# Source SQL.
+		src_sql = "SELECT * FROM users WHERE race = :race AND name IN :names;"
+
+		for src_params, dest_sql, dest_params in [
+			(
+				[
+					{'race': "Dwarf", 'names': ("Kili", "Fili")},
+					{'race': "Dwarf", 'names': ("Oin", "Gloin")},
+				],
+				"SELECT * FROM users WHERE race = ? AND name IN (?,?);",
+				[["Dwarf", "Kili", "Fili"], ["Dwarf", "Oin", "Gloin"]],
+			),
+			(
+				[
+					{'race': "Dwarf", 'names': ("Dori", "Nori", "Ori")},
+					{'race': "Hobbit", 'names': ("Bilbo", "Frodo", "Sam")},
+				],
+				"SELECT * FROM users WHERE race = ? AND name IN (?,?,?);",
+				[["Dwarf", "Dori", "Nori", "Ori"], ["Hobbit", "Bilbo", "Frodo", "Sam"]],
+			),
+		]:
+			with self.subTest(src_params=src_params):
+				# Format SQL with params.
+				sql, many_params = query.formatmany(src_sql, src_params)
+
+				# Make sure desired SQL and parameters are created.
+				self.assertEqual(sql, dest_sql)
+				self.assertEqual(many_params, dest_params)
+
+	def test_6_reuse_query_large_params(self) -> None:
+		"""
+		Test that a short query with too many parameters is not cached.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('named', 'qmark')
+		query_cache = query._SQLParams__converter._Converter__query_cache
+
+		# Source SQL.
+		count = _converting._QUERY_CACHE_MAX_PARAMS + 1
+		src_sql = "INSERT INTO users VALUES ({});".format(",".join(
+			f":p{__i}" for __i in range(count)
+		))
+		src_params = {f'p{__i}': __i for __i in range(count)}
+
+		# Desired SQL.
+		dest_sql = "INSERT INTO users VALUES ({});".format(",".join(["?"] * count))
+
+		# Make sure only the parameter limit is exceeded.
+		self.assertLessEqual(len(src_sql), _converting._QUERY_CACHE_MAX_SQL)
+
+		# Format SQL with params.
+		sql, params = query.format(src_sql, src_params)
+
+		# Make sure desired SQL and parameters are created.
+		self.assertEqual(sql, dest_sql)
+		self.assertEqual(params, list(range(count)))
+
+		# Make sure the large query is not cached.
+		self.assertEqual(len(query_cache), 0)
+
+		# Make sure a small query is still cached.
+		query.format("SELECT * FROM users WHERE id = :id;", {'id': 1})
+		self.assertEqual(len(query_cache), 1)
+
+	def test_6_reuse_query_large_in_sql(self) -> None:
+		"""
+		Test that a long query is not cached.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('named', 'qmark')
+		query_cache = query._SQLParams__converter._Converter__query_cache
+
+		# Source SQL.
+		count = 200
+		src_sql = "INSERT INTO users VALUES ({});".format(",".join(
+			f":a_very_long_parameter_name_{__i}" for __i in range(count)
+		))
+		src_params = {f'a_very_long_parameter_name_{__i}': __i for __i in range(count)}
+
+		# Desired SQL.
+		dest_sql = "INSERT INTO users VALUES ({});".format(",".join(["?"] * count))
+
+		# Make sure only the in-style SQL limit is exceeded.
+		self.assertGreater(len(src_sql), _converting._QUERY_CACHE_MAX_SQL)
+		self.assertLessEqual(len(dest_sql), _converting._QUERY_CACHE_MAX_SQL)
+		self.assertLessEqual(count, _converting._QUERY_CACHE_MAX_PARAMS)
+
+		# Format SQL with params.
+		sql, params = query.format(src_sql, src_params)
+
+		# Make sure desired SQL and parameters are created.
+		self.assertEqual(sql, dest_sql)
+		self.assertEqual(params, list(range(count)))
+
+		# Make sure the long query is not cached.
+		self.assertEqual(len(query_cache), 0)
+
+	def test_6_reuse_query_large_out_sql(self) -> None:
+		"""
+		Test that a short query which expands into a long query is not cached.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=True)
+		query_cache = query._SQLParams__converter._Converter__query_cache
+
+		# Source SQL.
+		count = _converting._QUERY_CACHE_MAX_SQL // 2
+		src_sql = "SELECT * FROM users WHERE id IN :ids;"
+		src_params = {'ids': tuple(range(count))}
+
+		# Desired SQL.
+		dest_sql = "SELECT * FROM users WHERE id IN ({});".format(",".join(["?"] * count))
+
+		# Make sure only the out-style SQL limit is exceeded.
+		self.assertGreater(len(dest_sql), _converting._QUERY_CACHE_MAX_SQL)
+
+		# Format SQL with params.
+		sql, params = query.format(src_sql, src_params)
+
+		# Make sure desired SQL and parameters are created.
+		self.assertEqual(sql, dest_sql)
+		self.assertEqual(params, list(range(count)))
+
+		# Make sure the expanded query is not cached.
+		self.assertEqual(len(query_cache), 0)
+
+	def test_6_reuse_query_evict(self) -> None:
+		"""
+		Test that the least recently used query is evicted when the cache is full.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=True)
+		query_cache = query._SQLParams__converter._Converter__query_cache
+
+		# Source SQL.
+		src_sql = "SELECT * FROM users WHERE name IN :names;"
+
+		with mock.patch.object(_converting, '_QUERY_CACHE_SIZE', 2):
+			# Fill the cache.
+			query.format(src_sql, {'names': ("Kili",)})
+			query.format(src_sql, {'names': ("Kili", "Fili")})
+
+			# Use the first query again.
+			query.format(src_sql, {'names': ("Oin",)})
+
+			# Make sure the least recently used query is evicted.
+			sql, params = query.format(src_sql, {'names': ("Dori", "Nori", "Ori")})
+			self.assertEqual(list(query_cache), [
+				(src_sql, (('names', 1),)),
+				(src_sql, (('names', 3),)),
+			])
+
+		# Make sure desired SQL and parameters are created.
+		self.assertEqual(sql, "SELECT * FROM users WHERE name IN (?,?,?);")
+		self.assertEqual(params, ["Dori", "Nori", "Ori"])
+
+	def test_6_reuse_query_many_large(self) -> None:
+		"""
+		Test that a large query is not cached with many sets of parameters.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('numeric', 'qmark')
+		query_cache = query._SQLParams__converter._Converter__query_cache
+
+		# Source SQL.
+		cols = _converting._QUERY_CACHE_MAX_PARAMS + 1
+		src_sql = "INSERT INTO users VALUES ({});".format(",".join(
+			f":{__i}" for __i in range(1, cols + 1)
+		))
+		src_params = [list(range(cols)), list(range(cols, cols * 2))]
+
+		# Desired SQL.
+		dest_sql = "INSERT INTO users VALUES ({});".format(",".join(["?"] * cols))
+
+		# Format SQL with params.
+		sql, many_params = query.formatmany(src_sql, src_params)
+
+		# Make sure desired SQL and parameters are created.
+		self.assertEqual(sql, dest_sql)
+		self.assertEqual(many_params, src_params)
+
+		# Make sure the large query is not cached.
+		self.assertEqual(len(query_cache), 0)
+
+	def test_6_reuse_query_threads(self) -> None:
+		"""
+		Test formatting queries with an instance shared between threads while
+		queries are evicted from the cache.
+		"""
+		# Create instance.
+		query = sqlparams.SQLParams('named', 'qmark')
+
+		errors = []
+
+		def run() -> None:
+			try:
+				for _ in range(200):
+					for i in range(8):
+						# Format SQL with params.
+						sql, params = query.format(f"SELECT :id, {i};", {'id': i})
+
+						# Make sure desired SQL and parameters are created.
+						assert sql == f"SELECT ?, {i};", sql
+						assert params == [i], params
+
+			except Exception as e:
+				errors.append(e)
+
+		with mock.patch.object(_converting, '_QUERY_CACHE_SIZE', 2):
+			threads = [threading.Thread(target=run) for _ in range(8)]
+			for thread in threads:
+				thread.start()
+
+			for thread in threads:
+				thread.join()
+
+		# Make sure no thread failed.
+		self.assertEqual(errors, [])
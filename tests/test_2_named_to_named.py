@@ -2,10 +2,11 @@
 This module tests converting named parameters to named parameters.
 """
 
-import copy
+import types
 import unittest
 
-import sqlparams
+from ._util import (
+	get_query)
 
 
 class Test(unittest.TestCase):
@@ -28,7 +29,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $name
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named_dollar')
+		query = get_query('named', 'named_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -44,7 +45,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = $id OR name = $name;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -64,7 +65,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $name
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named_dollar')
+		query = get_query('named', 'named_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -83,7 +84,48 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = $id OR name = $name;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = [dict(__row) for __row in src_params]
+
+		# Format SQL with params.
+		sql, many_params = query.formatmany(src_sql, src_params)
+
+		# Make sure desired SQL and parameters are created.
+		self.assertEqual(sql, dest_sql)
+		self.assertEqual(many_params, dest_params)
+
+	def test_1_named_to_named_dollar_many_generator(self):
+		"""
+		Test converting many from a generator of params::
+
+			... WHERE name = :name
+
+		to::
+
+			... WHERE name = $name
+		"""
+		# Create instance.
+		query = get_query('named', 'named_dollar')
+
+		# Source SQL and params.
+		src_sql = """
+			SELECT *
+			FROM users
+			WHERE id = :id OR name = :name;
+		"""
+		base_params = [
+			{'id': 1, 'name': "Dwalin"},
+			{'id': 9, 'name': "Gloin"},
+			{'id': 2, 'name': "Balin"},
+		]
+		src_params = (dict(__row) for __row in base_params)
+
+		# Desired SQL and params.
+		dest_sql = """
+			SELECT *
+			FROM users
+			WHERE id = $id OR name = $name;
+		"""
+		dest_params = [dict(__row) for __row in base_params]
 
 		# Format SQL with params.
 		sql, many_params = query.formatmany(src_sql, src_params)
@@ -103,7 +145,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(name)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'pyformat')
+		query = get_query('named_dollar', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -119,7 +161,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = %(id)s OR name = %(name)s;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -139,7 +181,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(name)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'pyformat')
+		query = get_query('named_dollar', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -159,7 +201,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = %(id)s OR name = %(name)s;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = [dict(__row) for __row in src_params]
 
 		# Format SQL with params.
 		sql, many_params = query.formatmany(src_sql, src_params)
@@ -179,7 +221,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(NAME)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'pyformat')
+		query = get_query('named_oracle', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -195,7 +237,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = %(ID)s OR name = %(NAME)s AND race = %(RACE)s;
 		"""
-		dest_params = {__key.upper(): __val for __key, __val in src_params.items()}
+		dest_params = {'ID': 4, 'NAME': "Fili", 'RACE': "dwarf"}
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -215,7 +257,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(name)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'pyformat')
+		query = get_query('named_oracle', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -231,9 +273,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = %(ID)s OR name = %(Name)s AND race = %(race)s;
 		"""
-		dest_params = {
-			__key.strip('"'): __val for __key, __val in src_params.items()
-		}
+		dest_params = {'ID': 4, 'Name': "Fili", 'race': "dwarf"}
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -253,7 +293,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(name)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'pyformat')
+		query = get_query('named_oracle', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -269,10 +309,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = %(ID)s OR name = %(Name)s AND race = %(RACE)s;
 		"""
-		dest_params = {
-			(__key.strip('"') if '"' in __key else __key.upper()): __val
-			for __key, __val in src_params.items()
-		}
+		dest_params = {'ID': 4, 'Name': "Fili", 'RACE': "Dwarf"}
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -292,7 +329,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(NAME)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'pyformat')
+		query = get_query('named_oracle', 'pyformat')
 
 		# Source SQL and params.
 		# - WARNING: Only the first row is scanned for the in-parameter names. All
@@ -315,8 +352,9 @@ class Test(unittest.TestCase):
 			WHERE id = %(ID)s OR name = %(NAME)s AND race = %(RACE)s;
 		"""
 		dest_params = [
-			{__key.upper(): __val for __key, __val in __row.items()}
-			for __row in src_params
+			{'ID': 6, 'NAME': "Nori", 'RACE': "dwarf"},
+			{'ID': 2, 'NAME': "Balin", 'RACE': "dwarf"},
+			{'ID': 10, 'NAME': "Bifur", 'RACE': "dwarf"},
 		]
 
 		# Format SQL with params.
@@ -337,7 +375,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(NAME)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'pyformat')
+		query = get_query('named_oracle', 'pyformat')
 
 		# Source SQL and params.
 		# - WARNING: Only the first row is scanned for the in-parameter names. All
@@ -360,8 +398,9 @@ class Test(unittest.TestCase):
 			WHERE id = %(ID)s OR name = %(Name)s AND race = %(race)s;
 		"""
 		dest_params = [
-			{__key.strip('"'): __val for __key, __val in __row.items()}
-			for __row in src_params
+			{'ID': 6, 'Name': "Nori", 'race': "dwarf"},
+			{'ID': 2, 'Name': "Balin", 'race': "dwarf"},
+			{'ID': 10, 'Name': "Bifur", 'race': "dwarf"},
 		]
 
 		# Format SQL with params.
@@ -382,7 +421,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(NAME)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'pyformat')
+		query = get_query('named_oracle', 'pyformat')
 
 		# Source SQL and params.
 		# - WARNING: Only the first row is scanned for the in-parameter names. All
@@ -404,10 +443,11 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = %(ID)s OR name = %(Name)s AND race = %(RACE)s;
 		"""
-		dest_params = [{
-			(__key.strip('"') if '"' in __key else __key.upper()): __val
-			for __key, __val in __row.items()
-		} for __row in src_params]
+		dest_params = [
+			{'ID': 6, 'Name': "Nori", 'RACE': "dwarf"},
+			{'ID': 2, 'Name': "Balin", 'RACE': "dwarf"},
+			{'ID': 10, 'Name': "Bifur", 'RACE': "dwarf"},
+		]
 
 		# Format SQL with params.
 		sql, many_params = query.formatmany(src_sql, src_params)
@@ -427,7 +467,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :name
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'named')
+		query = get_query('pyformat', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -443,7 +483,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = :id OR name = :name;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -463,7 +503,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :name
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'named')
+		query = get_query('pyformat', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -484,7 +524,49 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = :id OR name = :name;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = [dict(__row) for __row in src_params]
+
+		# Format SQL with params.
+		sql, many_params = query.formatmany(src_sql, src_params)
+
+		# Make sure desired SQL and parameters are created.
+		self.assertEqual(sql, dest_sql)
+		self.assertEqual(many_params, dest_params)
+
+	def test_1_pyformat_to_named_many_read_only(self):
+		"""
+		Test converting many from read-only params::
+
+			... WHERE name = %(name)s
+
+		to::
+
+			... WHERE name = :name
+		"""
+		# Create instance.
+		query = get_query('pyformat', 'named')
+
+		# Source SQL and params.
+		src_sql = """
+			SELECT *
+			FROM users
+			WHERE id = %(id)s OR name = %(name)s;
+		"""
+		base_params = [
+			{'id': 13, 'name': "Thorin"},
+			{'id': 6, 'name': "Nori"},
+			{'id': 12, 'name': "Bombur"},
+			{'id': 11, 'name': "Bofur"},
+		]
+		src_params = tuple(map(types.MappingProxyType, base_params))
+
+		# Desired SQL and params.
+		dest_sql = """
+			SELECT *
+			FROM users
+			WHERE id = :id OR name = :name;
+		"""
+		dest_params = [dict(__row) for __row in base_params]
 
 		# Format SQL with params.
 		sql, many_params = query.formatmany(src_sql, src_params)
@@ -504,7 +586,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :name
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'named_oracle')
+		query = get_query('pyformat', 'named_oracle')
 
 		# Source SQL and params.
 		src_sql = """
@@ -520,7 +602,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = :id OR name = :name;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -540,7 +622,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :"name"
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'named_oracle', allow_out_quotes=True)
+		query = get_query('pyformat', 'named_oracle', allow_out_quotes=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -570,7 +652,7 @@ class Test(unittest.TestCase):
 		Test expanding tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named', expand_tuples=True)
+		query = get_query('named', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -604,7 +686,7 @@ class Test(unittest.TestCase):
 		Test expanding tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams(
+		query = get_query(
 			in_style='named',
 			out_style='named_oracle',
 			expand_tuples=True,
@@ -644,7 +726,7 @@ class Test(unittest.TestCase):
 		disabled by default.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named')
+		query = get_query('named', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -660,7 +742,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = :race AND name IN :names;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -674,7 +756,7 @@ class Test(unittest.TestCase):
 		Test ignoring tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named', expand_tuples=False)
+		query = get_query('named', 'named', expand_tuples=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -690,7 +772,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = :race AND name IN :names;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -704,7 +786,7 @@ class Test(unittest.TestCase):
 		Test expanding empty tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named', expand_tuples=True)
+		query = get_query('named', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -734,7 +816,7 @@ class Test(unittest.TestCase):
 		Test expanding many tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named', expand_tuples=True)
+		query = get_query('named', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -772,7 +854,7 @@ class Test(unittest.TestCase):
 		Test many tuples with differing lengths.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named', expand_tuples=True)
+		query = get_query('named', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -794,7 +876,7 @@ class Test(unittest.TestCase):
 		Test many tuples with wrong types.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named', expand_tuples=True)
+		query = get_query('named', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -816,7 +898,7 @@ class Test(unittest.TestCase):
 		Test converting a named parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named')
+		query = get_query('named', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -832,7 +914,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = :id OR name = :name OR altid = :id OR altname = :name;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -846,7 +928,7 @@ class Test(unittest.TestCase):
 		Test converting a named parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named')
+		query = get_query('named', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -866,7 +948,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = :id OR name = :name OR altid = :id OR altname = :name;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = [dict(__row) for __row in src_params]
 
 		# Format SQL with params.
 		sql, many_params = query.formatmany(src_sql, src_params)
@@ -880,7 +962,7 @@ class Test(unittest.TestCase):
 		Test escaping a named dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'named', escape_char=True)
+		query = get_query('named_dollar', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -897,7 +979,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE name = :name AND tag IN ('$Y2941', '$2941');
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -911,7 +993,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a named dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'named', escape_char=False)
+		query = get_query('named_dollar', 'named', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -928,7 +1010,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE name = :name AND tag IN ('$$Y2941', '$2941');
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -942,7 +1024,7 @@ class Test(unittest.TestCase):
 		Test escaping a named parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named', escape_char=True)
+		query = get_query('named', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -959,7 +1041,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE name = :name AND tag IN (':Y2941', ':2941');
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -973,7 +1055,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a named parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named', escape_char=False)
+		query = get_query('named', 'named', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -990,7 +1072,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE name = :name AND tag IN ('::Y2941', ':2941');
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -1004,7 +1086,7 @@ class Test(unittest.TestCase):
 		Test escaping a pyformat parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'named', escape_char=True)
+		query = get_query('pyformat', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1021,7 +1103,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE name = :name AND tag IN ('%(Y2941)s', '%(2941)s');
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -1035,7 +1117,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a pyformat parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'named', escape_char=False)
+		query = get_query('pyformat', 'named', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1052,7 +1134,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE name = :name AND tag IN ('%%(Y2941)s', '%(2941)s');
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -1072,7 +1154,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % $value
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'named_dollar')
+		query = get_query('named', 'named_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1084,7 +1166,7 @@ class Test(unittest.TestCase):
 		dest_sql = """
 			SELECT 5 % $value;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -1104,7 +1186,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %(value)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'pyformat')
+		query = get_query('named', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1116,7 +1198,7 @@ class Test(unittest.TestCase):
 		dest_sql = """
 			SELECT 5 %% %(value)s;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -1136,7 +1218,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :value
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'named')
+		query = get_query('named_dollar', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1148,7 +1230,7 @@ class Test(unittest.TestCase):
 		dest_sql = """
 			SELECT 5 % :value;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -1168,7 +1250,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %(value)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'pyformat')
+		query = get_query('named_dollar', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1180,7 +1262,7 @@ class Test(unittest.TestCase):
 		dest_sql = """
 			SELECT 5 %% %(value)s;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -1200,7 +1282,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :value
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'named', escape_char=True)
+		query = get_query('pyformat', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1212,7 +1294,7 @@ class Test(unittest.TestCase):
 		dest_sql = """
 			SELECT 5 % :value;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -1232,7 +1314,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % $value
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'named_dollar', escape_char=True)
+		query = get_query('pyformat', 'named_dollar', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1244,7 +1326,7 @@ class Test(unittest.TestCase):
 		dest_sql = """
 			SELECT 5 % $value;
 		"""
-		dest_params = copy.deepcopy(src_params)
+		dest_params = dict(src_params)
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -4,7 +4,8 @@ This module tests converting named parameters to numeric parameters.
 
 import unittest
 
-import sqlparams
+from ._util import (
+	get_query)
 
 
 class Test(unittest.TestCase):
@@ -27,7 +28,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric_dollar')
+		query = get_query('named', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -63,7 +64,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric_dollar')
+		query = get_query('named', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -102,7 +103,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'numeric')
+		query = get_query('named_dollar', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -140,7 +141,7 @@ class Test(unittest.TestCase):
 		id, name = 11, "Bofur"
 
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'numeric')
+		query = get_query('named_dollar', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -180,7 +181,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'numeric')
+		query = get_query('named_oracle', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -196,7 +197,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = :1 OR name = :2 AND race = :3;
 		"""
-		dest_params = [src_params[__key] for __key in ['id', 'NAME', 'Race']]
+		dest_params = [4, "Fili", "dwarf"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -216,7 +217,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'numeric')
+		query = get_query('named_oracle', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -232,7 +233,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = :1 OR name = :2 AND race = :3;
 		"""
-		dest_params = [src_params[__key] for __key in ['"ID"', '"Name"', '"race"']]
+		dest_params = [4, "Fili", "dwarf"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -252,7 +253,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'numeric')
+		query = get_query('named_oracle', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -268,7 +269,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE id = :1 OR name = :2 AND race = :3;
 		"""
-		dest_params = [src_params[__key] for __key in ['id', '"Name"', '"RACE"']]
+		dest_params = [4, "Fili", "dwarf"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -288,7 +289,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'numeric')
+		query = get_query('named_oracle', 'numeric')
 
 		# Source SQL and params.
 		# - WARNING: Only the first row is scanned for the in-parameter names. All
@@ -311,8 +312,9 @@ class Test(unittest.TestCase):
 			WHERE id = :1 OR name = :2 AND race = :3;
 		"""
 		dest_params = [
-			[__row[__key] for __key in ['id', 'NAME', 'Race']]
-			for __row in src_params
+			[7, "Ori", "dwarf"],
+			[5, "Dori", "dwarf"],
+			[10, "Bifur", "dwarf"],
 		]
 
 		# Format SQL with params.
@@ -333,7 +335,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'numeric')
+		query = get_query('named_oracle', 'numeric')
 
 		# Source SQL and params.
 		# - WARNING: Only the first row is scanned for the in-parameter names. All
@@ -356,8 +358,9 @@ class Test(unittest.TestCase):
 			WHERE id = :1 OR name = :2 AND race = :3;
 		"""
 		dest_params = [
-			[__row[__key] for __key in ['"ID"', '"Name"', '"race"']]
-			for __row in src_params
+			[7, "Ori", "dwarf"],
+			[5, "Dori", "dwarf"],
+			[10, "Bifur", "dwarf"],
 		]
 
 		# Format SQL with params.
@@ -378,7 +381,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'numeric')
+		query = get_query('named_oracle', 'numeric')
 
 		# Source SQL and params.
 		# - WARNING: Only the first row is scanned for the in-parameter names. All
@@ -401,8 +404,9 @@ class Test(unittest.TestCase):
 			WHERE id = :1 OR name = :2 AND race = :3;
 		"""
 		dest_params = [
-			[__row[__key] for __key in ['id', '"Name"', '"RACE"']]
-			for __row in src_params
+			[7, "Ori", "dwarf"],
+			[5, "Dori", "dwarf"],
+			[10, "Bifur", "dwarf"],
 		]
 
 		# Format SQL with params.
@@ -423,7 +427,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'numeric_dollar')
+		query = get_query('pyformat', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -459,7 +463,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'numeric_dollar')
+		query = get_query('pyformat', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -494,7 +498,7 @@ class Test(unittest.TestCase):
 		Test expanding tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric', expand_tuples=True)
+		query = get_query('named', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -510,7 +514,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = :1 AND name IN (:2,:3);
 		"""
-		dest_params = [src_params['race']] + list(src_params['names'])
+		dest_params = ["Dwarf", "Dwalin", "Balin"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -525,7 +529,7 @@ class Test(unittest.TestCase):
 		should be enabled by default.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric')
+		query = get_query('named', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -541,7 +545,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = :1 AND name IN (:2,:3);
 		"""
-		dest_params = [src_params['race']] + list(src_params['names'])
+		dest_params = ["Dwarf", "Dwalin", "Balin"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -555,7 +559,7 @@ class Test(unittest.TestCase):
 		Test ignoring tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric', expand_tuples=False)
+		query = get_query('named', 'numeric', expand_tuples=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -571,7 +575,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = :1 AND name IN :2;
 		"""
-		dest_params = [src_params['race'], src_params['names']]
+		dest_params = ["Dwarf", ("Dwalin", "Balin")]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -585,7 +589,7 @@ class Test(unittest.TestCase):
 		Test expanding empty tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric', expand_tuples=True)
+		query = get_query('named', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -601,7 +605,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = :1 AND name IN (NULL);
 		"""
-		dest_params = [src_params['race']]
+		dest_params = ["Dwarf"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -615,7 +619,7 @@ class Test(unittest.TestCase):
 		Test expanding many tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric', expand_tuples=True)
+		query = get_query('named', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -635,7 +639,11 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = :1 AND name IN (:2,:3);
 		"""
-		dest_params = [[__row['race']] + list(__row['names']) for __row in src_params]
+		dest_params = [
+			["Dwarf", "Dwalin", "Balin"],
+			["Dwarf", "Kili", "Fili"],
+			["Dwarf", "Oin", "Gloin"],
+		]
 
 		# Format SQL with params.
 		sql, many_params = query.formatmany(src_sql, src_params)
@@ -649,7 +657,7 @@ class Test(unittest.TestCase):
 		Test many tuples with differing lengths.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric', expand_tuples=True)
+		query = get_query('named', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -671,7 +679,7 @@ class Test(unittest.TestCase):
 		Test many tuples with wrong types.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric', expand_tuples=True)
+		query = get_query('named', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -693,7 +701,7 @@ class Test(unittest.TestCase):
 		Test converting a named parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric')
+		query = get_query('named', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -723,7 +731,7 @@ class Test(unittest.TestCase):
 		Test converting a named parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric')
+		query = get_query('named', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -752,12 +760,46 @@ class Test(unittest.TestCase):
 		self.assertEqual(sql, dest_sql)
 		self.assertEqual(many_params, dest_params)
 
+	def test_3_single_many(self):
+		"""
+		Test converting a single named parameter with many sets of parameters.
+		"""
+		# Create instance.
+		query = get_query('named', 'numeric')
+
+		# Source SQL and params.
+		src_sql = """
+			SELECT *
+			FROM users
+			WHERE name = :name OR altname = :name;
+		"""
+		src_params = [
+			{'name': "Bombur"},
+			{'name': "Kili"},
+			{'name': "Nori"},
+		]
+
+		# Desired SQL and params.
+		dest_sql = """
+			SELECT *
+			FROM users
+			WHERE name = :1 OR altname = :1;
+		"""
+		dest_params = [["Bombur"], ["Kili"], ["Nori"]]
+
+		# Format SQL with params.
+		sql, many_params = query.formatmany(src_sql, src_params)
+
+		# Make sure desired SQL and parameters are created.
+		self.assertEqual(sql, dest_sql)
+		self.assertEqual(many_params, dest_params)
+
 	def test_4_named_dollar_escape_char(self):
 		"""
 		Test escaping a named dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'numeric', escape_char=True)
+		query = get_query('named_dollar', 'numeric', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -788,7 +830,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a named dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'numeric', escape_char=False)
+		query = get_query('named_dollar', 'numeric', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -819,7 +861,7 @@ class Test(unittest.TestCase):
 		Test escaping a named parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric', escape_char=True)
+		query = get_query('named', 'numeric', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -850,7 +892,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a named parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric', escape_char=False)
+		query = get_query('named', 'numeric', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -881,7 +923,7 @@ class Test(unittest.TestCase):
 		Test escaping a pyformat parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'numeric', escape_char=True)
+		query = get_query('pyformat', 'numeric', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -912,7 +954,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a pyformat parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'numeric', escape_char=False)
+		query = get_query('pyformat', 'numeric', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -949,7 +991,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric')
+		query = get_query('named', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -982,7 +1024,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'numeric_dollar')
+		query = get_query('named', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1015,7 +1057,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'numeric')
+		query = get_query('named_dollar', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1048,7 +1090,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'numeric_dollar')
+		query = get_query('named_dollar', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1081,7 +1123,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'numeric', escape_char=True)
+		query = get_query('pyformat', 'numeric', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1114,7 +1156,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'numeric_dollar', escape_char=True)
+		query = get_query('pyformat', 'numeric_dollar', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -4,7 +4,8 @@ This module tests converting named parameters to ordinal parameters.
 
 import unittest
 
-import sqlparams
+from ._util import (
+	get_query)
 
 
 class Test(unittest.TestCase):
@@ -27,7 +28,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'format')
+		query = get_query('named', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -63,7 +64,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'format')
+		query = get_query('named', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -102,7 +103,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'qmark')
+		query = get_query('named_dollar', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -138,7 +139,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'qmark')
+		query = get_query('named_dollar', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -178,7 +179,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'qmark')
+		query = get_query('named_oracle', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -214,7 +215,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'qmark')
+		query = get_query('named_oracle', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -250,7 +251,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'qmark')
+		query = get_query('named_oracle', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -286,7 +287,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'qmark')
+		query = get_query('named_oracle', 'qmark')
 
 		# Source SQL and params.
 		# - WARNING: Only the first row is scanned for the in-parameter names. All
@@ -331,7 +332,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'qmark')
+		query = get_query('named_oracle', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -374,7 +375,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_oracle', 'qmark')
+		query = get_query('named_oracle', 'qmark')
 
 		# Source SQL and params.
 		# - WARNING: Only the first row is scanned for the in-parameter names. All
@@ -419,7 +420,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_sqlserver', 'qmark')
+		query = get_query('named_sqlserver', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -455,7 +456,7 @@ class Test(unittest.TestCase):
 			... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_sqlserver', 'qmark')
+		query = get_query('named_sqlserver', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -495,7 +496,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'format')
+		query = get_query('pyformat', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -531,7 +532,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'format')
+		query = get_query('pyformat', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -566,7 +567,7 @@ class Test(unittest.TestCase):
 		Test expanding tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=True)
+		query = get_query('named', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -582,7 +583,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN (?,?);
 		"""
-		dest_params = [src_params['race']] + list(src_params['names'])
+		dest_params = ["Dwarf", "Dwalin", "Balin"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -597,7 +598,7 @@ class Test(unittest.TestCase):
 		should be enabled by default.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark')
+		query = get_query('named', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -613,7 +614,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN (?,?);
 		"""
-		dest_params = [src_params['race']] + list(src_params['names'])
+		dest_params = ["Dwarf", "Dwalin", "Balin"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -627,7 +628,7 @@ class Test(unittest.TestCase):
 		Test ignoring tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=False)
+		query = get_query('named', 'qmark', expand_tuples=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -643,7 +644,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN ?;
 		"""
-		dest_params = [src_params['race'], src_params['names']]
+		dest_params = ["Dwarf", ("Dwalin", "Balin")]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -657,7 +658,7 @@ class Test(unittest.TestCase):
 		Test expanding empty tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=True)
+		query = get_query('named', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -673,7 +674,7 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN (NULL);
 		"""
-		dest_params = [src_params['race']]
+		dest_params = ["Dwarf"]
 
 		# Format SQL with params.
 		sql, params = query.format(src_sql, src_params)
@@ -687,7 +688,7 @@ class Test(unittest.TestCase):
 		Test expanding many tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=True)
+		query = get_query('named', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -707,7 +708,11 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN (?,?);
 		"""
-		dest_params = [[__row['race']] + list(__row['names']) for __row in src_params]
+		dest_params = [
+			["Dwarf", "Dwalin", "Balin"],
+			["Dwarf", "Kili", "Fili"],
+			["Dwarf", "Oin", "Gloin"],
+		]
 
 		# Format SQL with params.
 		sql, many_params = query.formatmany(src_sql, src_params)
@@ -721,7 +726,7 @@ class Test(unittest.TestCase):
 		Test many tuples with differing lengths.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=True)
+		query = get_query('named', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -743,7 +748,7 @@ class Test(unittest.TestCase):
 		Test many tuples with wrong types.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark', expand_tuples=True)
+		query = get_query('named', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -765,7 +770,7 @@ class Test(unittest.TestCase):
 		Test converting a named parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark')
+		query = get_query('named', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -800,7 +805,7 @@ class Test(unittest.TestCase):
 		Test converting a named parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark')
+		query = get_query('named', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -837,7 +842,7 @@ class Test(unittest.TestCase):
 		Test escaping a named dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'qmark', escape_char=True)
+		query = get_query('named_dollar', 'qmark', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -868,7 +873,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a named dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_dollar', 'qmark', escape_char=False)
+		query = get_query('named_dollar', 'qmark', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -899,7 +904,7 @@ class Test(unittest.TestCase):
 		Test escaping a named parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark', escape_char=True)
+		query = get_query('named', 'qmark', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -930,7 +935,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a named parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark', escape_char=False)
+		query = get_query('named', 'qmark', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -961,7 +966,7 @@ class Test(unittest.TestCase):
 		Test escaping a named sqlserver parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_sqlserver', 'qmark', escape_char=True)
+		query = get_query('named_sqlserver', 'qmark', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -992,7 +997,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a named sqlserver parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named_sqlserver', 'qmark', escape_char=False)
+		query = get_query('named_sqlserver', 'qmark', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1023,7 +1028,7 @@ class Test(unittest.TestCase):
 		Test escaping a pyformat parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'qmark', escape_char=True)
+		query = get_query('pyformat', 'qmark', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1054,7 +1059,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a pyformat parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'qmark', escape_char=False)
+		query = get_query('pyformat', 'qmark', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1091,7 +1096,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'format')
+		query = get_query('named', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1124,7 +1129,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('named', 'qmark')
+		query = get_query('named', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1157,7 +1162,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'format')
+		query = get_query('pyformat', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1190,7 +1195,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('pyformat', 'qmark', escape_char=True)
+		query = get_query('pyformat', 'qmark', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
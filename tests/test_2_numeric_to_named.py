@@ -4,7 +4,8 @@ This module tests converting numeric parameters to named parameters.
 
 import unittest
 
-import sqlparams
+from ._util import (
+	get_query)
 
 
 class Test(unittest.TestCase):
@@ -27,7 +28,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'named')
+		query = get_query('numeric_dollar', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -49,8 +50,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': id, '_2': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -71,7 +72,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'named')
+		query = get_query('numeric_dollar', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -99,8 +100,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -121,7 +122,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'named_oracle')
+		query = get_query('numeric_dollar', 'named_oracle')
 
 		# Source SQL and params.
 		src_sql = """
@@ -143,8 +144,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': id, '_2': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -165,7 +166,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :"_1"
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams(
+		query = get_query(
 			in_style='numeric_dollar',
 			out_style='named_oracle',
 			allow_out_quotes=True,
@@ -191,8 +192,8 @@ class Test(unittest.TestCase):
 		dest_params = {'"_1"': id, '"_2"': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -213,7 +214,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'named_oracle')
+		query = get_query('numeric_dollar', 'named_oracle')
 
 		# Source SQL and params.
 		src_sql = """
@@ -241,8 +242,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -263,7 +264,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :"_1"
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams(
+		query = get_query(
 			in_style='numeric_dollar',
 			out_style='named_oracle',
 			allow_out_quotes=True,
@@ -295,8 +296,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -319,7 +320,7 @@ class Test(unittest.TestCase):
 		id, name = 9, "Gloin"
 
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'pyformat')
+		query = get_query('numeric_dollar', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -340,8 +341,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_2': id, '_1': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -362,7 +363,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %(_1)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'pyformat')
+		query = get_query('numeric_dollar', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -391,8 +392,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -413,7 +414,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named_dollar')
+		query = get_query('numeric', 'named_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -435,8 +436,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': id, '_2': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -457,7 +458,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named_dollar')
+		query = get_query('numeric', 'named_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -487,8 +488,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -509,7 +510,7 @@ class Test(unittest.TestCase):
 			... WHERE name = @_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named_sqlserver')
+		query = get_query('numeric', 'named_sqlserver')
 
 		# Source SQL and params.
 		src_sql = """
@@ -531,8 +532,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': id, '_2': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -553,7 +554,7 @@ class Test(unittest.TestCase):
 			... WHERE name = @_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named_sqlserver')
+		query = get_query('numeric', 'named_sqlserver')
 
 		# Source SQL and params.
 		src_sql = """
@@ -583,8 +584,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -599,7 +600,7 @@ class Test(unittest.TestCase):
 		Test expanding tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named', expand_tuples=True)
+		query = get_query('numeric', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -621,8 +622,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': race, '_2_0': names[0], '_2_1': names[1]}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -638,7 +639,7 @@ class Test(unittest.TestCase):
 		should be disabled by default.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named')
+		query = get_query('numeric', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -660,8 +661,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': race, '_2': names}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -676,7 +677,7 @@ class Test(unittest.TestCase):
 		Test ignoring tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named', expand_tuples=False)
+		query = get_query('numeric', 'named', expand_tuples=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -698,8 +699,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': race, '_2': names}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -714,7 +715,7 @@ class Test(unittest.TestCase):
 		Test expanding empty tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named', expand_tuples=True)
+		query = get_query('numeric', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -736,8 +737,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': race}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -752,7 +753,7 @@ class Test(unittest.TestCase):
 		Test expanding many tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named', expand_tuples=True)
+		query = get_query('numeric', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -788,8 +789,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -804,7 +805,7 @@ class Test(unittest.TestCase):
 		Test many tuples with differing lengths.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named', expand_tuples=True)
+		query = get_query('numeric', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -827,8 +828,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -840,7 +841,7 @@ class Test(unittest.TestCase):
 		Test many tuples with wrong types.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named', expand_tuples=True)
+		query = get_query('numeric', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -863,8 +864,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -876,7 +877,7 @@ class Test(unittest.TestCase):
 		Test converting a numeric parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named')
+		query = get_query('numeric', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -898,8 +899,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': id, '_2': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -914,7 +915,7 @@ class Test(unittest.TestCase):
 		Test converting a numeric parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named')
+		query = get_query('numeric', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -943,8 +944,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -959,7 +960,7 @@ class Test(unittest.TestCase):
 		Test escaping a numeric dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'named', escape_char=True)
+		query = get_query('numeric_dollar', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -990,7 +991,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a numeric dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'named', escape_char=False)
+		query = get_query('numeric_dollar', 'named', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1021,7 +1022,7 @@ class Test(unittest.TestCase):
 		Test escaping a numeric parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named', escape_char=True)
+		query = get_query('numeric', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1052,7 +1053,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a numeric parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named', escape_char=False)
+		query = get_query('numeric', 'named', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1089,7 +1090,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'named')
+		query = get_query('numeric', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1122,7 +1123,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %(_1)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'pyformat')
+		query = get_query('numeric', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1155,7 +1156,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % $_1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'named_dollar')
+		query = get_query('numeric_dollar', 'named_dollar')
 
 		# Source SQL and params.
 		src_sql = """
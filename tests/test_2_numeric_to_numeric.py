@@ -4,7 +4,8 @@ This module tests converting numeric parameters to numeric parameters.
 
 import unittest
 
-import sqlparams
+from ._util import (
+	get_query)
 
 
 class Test(unittest.TestCase):
@@ -27,7 +28,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'numeric')
+		query = get_query('numeric_dollar', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -49,8 +50,8 @@ class Test(unittest.TestCase):
 		dest_params = [id, name]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -71,7 +72,7 @@ class Test(unittest.TestCase):
 			... WHERE name = :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'numeric')
+		query = get_query('numeric_dollar', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -96,8 +97,8 @@ class Test(unittest.TestCase):
 		dest_params = [[__row['id'], __row['name']] for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -118,7 +119,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric_dollar')
+		query = get_query('numeric', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -140,8 +141,8 @@ class Test(unittest.TestCase):
 		dest_params = [id, name]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -162,7 +163,7 @@ class Test(unittest.TestCase):
 			... WHERE name = $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric_dollar')
+		query = get_query('numeric', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -188,8 +189,8 @@ class Test(unittest.TestCase):
 		dest_params = [[__row['id'], __row['name']] for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -204,7 +205,7 @@ class Test(unittest.TestCase):
 		Test expanding tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric', expand_tuples=True)
+		query = get_query('numeric', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -226,8 +227,8 @@ class Test(unittest.TestCase):
 		dest_params = [race] + list(names)
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -243,7 +244,7 @@ class Test(unittest.TestCase):
 		should be enabled by default.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric')
+		query = get_query('numeric', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -265,8 +266,8 @@ class Test(unittest.TestCase):
 		dest_params = [race] + list(names)
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -281,7 +282,7 @@ class Test(unittest.TestCase):
 		Test ignoring tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric', expand_tuples=False)
+		query = get_query('numeric', 'numeric', expand_tuples=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -303,8 +304,8 @@ class Test(unittest.TestCase):
 		dest_params = [race, names[:]]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -319,7 +320,7 @@ class Test(unittest.TestCase):
 		Test expanding empty tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric', expand_tuples=True)
+		query = get_query('numeric', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -341,8 +342,8 @@ class Test(unittest.TestCase):
 		dest_params = [race]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -357,7 +358,7 @@ class Test(unittest.TestCase):
 		Test expanding many tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric', expand_tuples=True)
+		query = get_query('numeric', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -391,8 +392,8 @@ class Test(unittest.TestCase):
 		]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -407,7 +408,7 @@ class Test(unittest.TestCase):
 		Test many tuples with differing lengths.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric', expand_tuples=True)
+		query = get_query('numeric', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -430,8 +431,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -443,7 +444,7 @@ class Test(unittest.TestCase):
 		Test many tuples with wrong types.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric', expand_tuples=True)
+		query = get_query('numeric', 'numeric', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -466,8 +467,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -479,7 +480,7 @@ class Test(unittest.TestCase):
 		Test converting a numeric parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric')
+		query = get_query('numeric', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -501,8 +502,8 @@ class Test(unittest.TestCase):
 		dest_params = [id, name]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -517,7 +518,7 @@ class Test(unittest.TestCase):
 		Test converting a numeric parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric')
+		query = get_query('numeric', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
@@ -543,8 +544,8 @@ class Test(unittest.TestCase):
 		dest_params = [[__row['id'], __row['name']] for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -559,7 +560,7 @@ class Test(unittest.TestCase):
 		Test escaping a numeric dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'numeric', escape_char=True)
+		query = get_query('numeric_dollar', 'numeric', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -590,7 +591,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a numeric dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'numeric', escape_char=False)
+		query = get_query('numeric_dollar', 'numeric', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -621,7 +622,7 @@ class Test(unittest.TestCase):
 		Test escaping a numeric parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric', escape_char=True)
+		query = get_query('numeric', 'numeric', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -652,7 +653,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a numeric parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric', escape_char=False)
+		query = get_query('numeric', 'numeric', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -689,7 +690,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % $1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'numeric_dollar')
+		query = get_query('numeric', 'numeric_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -722,7 +723,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :1
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'numeric')
+		query = get_query('numeric_dollar', 'numeric')
 
 		# Source SQL and params.
 		src_sql = """
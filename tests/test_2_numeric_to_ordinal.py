@@ -4,7 +4,8 @@ This module tests converting numeric parameters to ordinal parameters.
 
 import unittest
 
-import sqlparams
+from ._util import (
+	get_query)
 
 
 class Test(unittest.TestCase):
@@ -27,7 +28,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark')
+		query = get_query('numeric', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -49,8 +50,8 @@ class Test(unittest.TestCase):
 		dest_params = [id, name]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -71,7 +72,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark')
+		query = get_query('numeric', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -97,8 +98,8 @@ class Test(unittest.TestCase):
 		dest_params = [[__row['id'], __row['name']] for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -119,7 +120,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'format')
+		query = get_query('numeric_dollar', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -141,8 +142,8 @@ class Test(unittest.TestCase):
 		dest_params = [id, name]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -163,7 +164,7 @@ class Test(unittest.TestCase):
 			... WHERE name = %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'format')
+		query = get_query('numeric_dollar', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -188,8 +189,8 @@ class Test(unittest.TestCase):
 		dest_params = [[__row['id'], __row['name']] for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -204,7 +205,7 @@ class Test(unittest.TestCase):
 		Test expanding tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark', expand_tuples=True)
+		query = get_query('numeric', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -223,11 +224,11 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN (?,?);
 		"""
-		dest_params = [race] + list(names)
+		dest_params = ["Dwarf", "Kili", "Fili"]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -243,7 +244,7 @@ class Test(unittest.TestCase):
 		should be enabled by default.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark')
+		query = get_query('numeric', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -262,11 +263,11 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN (?,?);
 		"""
-		dest_params = [race] + list(names)
+		dest_params = ["Dwarf", "Kili", "Fili"]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -281,7 +282,7 @@ class Test(unittest.TestCase):
 		Test ignoring tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark', expand_tuples=False)
+		query = get_query('numeric', 'qmark', expand_tuples=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -300,11 +301,11 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN ?;
 		"""
-		dest_params = [race, names[:]]
+		dest_params = ["Dwarf", ("Kili", "Fili")]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -319,7 +320,7 @@ class Test(unittest.TestCase):
 		Test expanding empty tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark', expand_tuples=True)
+		query = get_query('numeric', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -338,11 +339,11 @@ class Test(unittest.TestCase):
 			FROM users
 			WHERE race = ? AND name IN (NULL);
 		"""
-		dest_params = [race]
+		dest_params = ["Dwarf"]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -357,7 +358,7 @@ class Test(unittest.TestCase):
 		Test expanding many tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark', expand_tuples=True)
+		query = get_query('numeric', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -387,12 +388,14 @@ class Test(unittest.TestCase):
 			WHERE race = ? AND name IN (?,?);
 		"""
 		dest_params = [
-			[__row['race']] + list(__row['names']) for __row in base_params
+			["Dwarf", "Dwalin", "Balin"],
+			["Dwarf", "Kili", "Fili"],
+			["Dwarf", "Oin", "Gloin"],
 		]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -407,7 +410,7 @@ class Test(unittest.TestCase):
 		Test many tuples with differing lengths.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark', expand_tuples=True)
+		query = get_query('numeric', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -430,8 +433,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -443,7 +446,7 @@ class Test(unittest.TestCase):
 		Test many tuples with wrong types.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark', expand_tuples=True)
+		query = get_query('numeric', 'qmark', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -466,8 +469,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -479,7 +482,7 @@ class Test(unittest.TestCase):
 		Test converting a numeric parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark')
+		query = get_query('numeric', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -501,8 +504,8 @@ class Test(unittest.TestCase):
 		dest_params = [id, name, id, name]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -517,7 +520,7 @@ class Test(unittest.TestCase):
 		Test converting a numeric parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark')
+		query = get_query('numeric', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -546,8 +549,8 @@ class Test(unittest.TestCase):
 		]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -562,7 +565,7 @@ class Test(unittest.TestCase):
 		Test escaping a numeric dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'qmark', escape_char=True)
+		query = get_query('numeric_dollar', 'qmark', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -593,7 +596,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a numeric dollar parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'qmark', escape_char=False)
+		query = get_query('numeric_dollar', 'qmark', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -624,7 +627,7 @@ class Test(unittest.TestCase):
 		Test escaping a numeric parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark', escape_char=True)
+		query = get_query('numeric', 'qmark', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -655,7 +658,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a numeric parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark', escape_char=False)
+		query = get_query('numeric', 'qmark', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -692,7 +695,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'format')
+		query = get_query('numeric', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -725,7 +728,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric', 'qmark')
+		query = get_query('numeric', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -758,7 +761,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'format')
+		query = get_query('numeric_dollar', 'format')
 
 		# Source SQL and params.
 		src_sql = """
@@ -791,7 +794,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % ?
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('numeric_dollar', 'qmark')
+		query = get_query('numeric_dollar', 'qmark')
 
 		# Source SQL and params.
 		src_sql = """
@@ -4,7 +4,8 @@ This module tests converting ordinal parameters to named parameters.
 
 import unittest
 
-import sqlparams
+from ._util import (
+	get_query)
 
 
 class Test(unittest.TestCase):
@@ -27,7 +28,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = :_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('format', 'named')
+		query = get_query('format', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -49,8 +50,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': id, '_1': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -71,7 +72,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = :_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('format', 'named')
+		query = get_query('format', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -99,8 +100,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -121,7 +122,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = %(_0)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('format', 'pyformat')
+		query = get_query('format', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -143,8 +144,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_1': id, '_0': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -165,7 +166,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = %(_0)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('format', 'pyformat')
+		query = get_query('format', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -194,8 +195,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -216,7 +217,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = $_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named_dollar')
+		query = get_query('qmark', 'named_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -238,8 +239,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': id, '_1': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -260,7 +261,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = $_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named_dollar')
+		query = get_query('qmark', 'named_dollar')
 
 		# Source SQL and params.
 		src_sql = """
@@ -290,8 +291,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -312,7 +313,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = :_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named_oracle')
+		query = get_query('qmark', 'named_oracle')
 
 		# Source SQL and params.
 		src_sql = """
@@ -334,8 +335,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': id, '_1': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -356,7 +357,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = :"_0"
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named_oracle', allow_out_quotes=True)
+		query = get_query('qmark', 'named_oracle', allow_out_quotes=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -378,8 +379,8 @@ class Test(unittest.TestCase):
 		dest_params = {'"_0"': id, '"_1"': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -400,7 +401,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = :_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named_oracle')
+		query = get_query('qmark', 'named_oracle')
 
 		# Source SQL and params.
 		src_sql = """
@@ -430,8 +431,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -452,7 +453,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = :_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named_oracle', allow_out_quotes=True)
+		query = get_query('qmark', 'named_oracle', allow_out_quotes=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -482,8 +483,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -504,7 +505,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = @_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named_sqlserver')
+		query = get_query('qmark', 'named_sqlserver')
 
 		# Source SQL and params.
 		src_sql = """
@@ -526,8 +527,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': id, '_1': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -548,7 +549,7 @@ class Test(unittest.TestCase):
 		  ... WHERE name = @_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named_sqlserver')
+		query = get_query('qmark', 'named_sqlserver')
 
 		# Source SQL and params.
 		src_sql = """
@@ -578,8 +579,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -594,7 +595,7 @@ class Test(unittest.TestCase):
 		Test expanding tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named', expand_tuples=True)
+		query = get_query('qmark', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -616,8 +617,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': race, '_1_0': names[0], '_1_1': names[1]}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -633,7 +634,7 @@ class Test(unittest.TestCase):
 		should be disabled by default.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named')
+		query = get_query('qmark', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -655,8 +656,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': race, '_1': names[:]}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -671,7 +672,7 @@ class Test(unittest.TestCase):
 		Test ignoring tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named', expand_tuples=False)
+		query = get_query('qmark', 'named', expand_tuples=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -693,8 +694,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': race, '_1': names[:]}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -709,7 +710,7 @@ class Test(unittest.TestCase):
 		Test expanding empty tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named', expand_tuples=True)
+		query = get_query('qmark', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -731,8 +732,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': race}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -747,7 +748,7 @@ class Test(unittest.TestCase):
 		Test expanding many tuples.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named', expand_tuples=True)
+		query = get_query('qmark', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -783,8 +784,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -799,7 +800,7 @@ class Test(unittest.TestCase):
 		Test many tuples with differing lengths.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named', expand_tuples=True)
+		query = get_query('qmark', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -822,8 +823,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -835,7 +836,7 @@ class Test(unittest.TestCase):
 		Test many tuples with wrong types.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named', expand_tuples=True)
+		query = get_query('qmark', 'named', expand_tuples=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -858,8 +859,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -871,7 +872,7 @@ class Test(unittest.TestCase):
 		Test converting an ordinal parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named')
+		query = get_query('qmark', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -893,8 +894,8 @@ class Test(unittest.TestCase):
 		dest_params = {'_0': id, '_1': name, '_2': id, '_3': name}
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -909,7 +910,7 @@ class Test(unittest.TestCase):
 		Test converting a ordinal parameter where it occurs multiple times.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named')
+		query = get_query('qmark', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -953,8 +954,8 @@ class Test(unittest.TestCase):
 		} for __row in base_params]
 
 		for src_params, src in zip(
-			[seq_params, int_params, str_params],
-			['seq', 'int', 'str'],
+			(seq_params, int_params, str_params),
+			('seq', 'int', 'str'),
 		):
 			with self.subTest(src=src):
 				# Format SQL with params.
@@ -969,7 +970,7 @@ class Test(unittest.TestCase):
 		Test escaping a format parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('format', 'named', escape_char=True)
+		query = get_query('format', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1000,7 +1001,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a format parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('format', 'named', escape_char=False)
+		query = get_query('format', 'named', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1031,7 +1032,7 @@ class Test(unittest.TestCase):
 		Test escaping a qmark parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named', escape_char=True)
+		query = get_query('qmark', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1062,7 +1063,7 @@ class Test(unittest.TestCase):
 		Test disabling escaping of a qmark parameter.
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named', escape_char=False)
+		query = get_query('qmark', 'named', escape_char=False)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1099,7 +1100,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('format', 'named', escape_char=True)
+		query = get_query('format', 'named', escape_char=True)
 
 		# Source SQL and params.
 		src_sql = """
@@ -1132,7 +1133,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %(_0)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('format', 'pyformat')
+		query = get_query('format', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1165,7 +1166,7 @@ class Test(unittest.TestCase):
 			SELECT 5 % :_0
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'named')
+		query = get_query('qmark', 'named')
 
 		# Source SQL and params.
 		src_sql = """
@@ -1198,7 +1199,7 @@ class Test(unittest.TestCase):
 			SELECT 5 %% %(_0)s
 		"""
 		# Create instance.
-		query = sqlparams.SQLParams('qmark', 'pyformat')
+		query = get_query('qmark', 'pyformat')
 
 		# Source SQL and params.
 		src_sql = """